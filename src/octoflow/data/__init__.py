@@ -6,14 +6,14 @@ from typing import Optional, Union
 from octoflow.data.dataclass import field
 from octoflow.data.dataset import DEFAULT_FORMAT, Dataset
 from octoflow.data.expression import Expression, scalar
-from octoflow.data.loaders import dataloader
-from octoflow.data.loaders import loaders as _loaders
+from octoflow.data.loaders import dataloader, get_loader
 
 __all__ = [
     "Dataset",
     "Expression",
     "dataloader",
     "field",
+    "get_loader",
     "load_dataset",
     "scalar",
 ]
@@ -52,11 +52,7 @@ def load_dataset(
     Dataset
         The loaded dataset.
     """
-    loader = _loaders.get(__loader)
-    if loader is None:
-        # notify the user that the loader is not found
-        msg = f"loader '{__loader}' not found"
-        raise ValueError(msg)
+    loader = get_loader(__loader)
     if loader.path_arg is not None:
         kwargs[loader.path_arg] = __path
     else:
@@ -46,4 +46,5 @@ BaseExpression = PyArrowWrapper[ds.Expression]
 BaseDataset = PyArrowWrapper[ds.Dataset]
 
 
-class BaseDatasetLoader(Generic[P, R]): ...
+class BaseDatasetLoader(Generic[P, R]):
+    __slots__ = ()
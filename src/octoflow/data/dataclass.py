@@ -129,9 +129,11 @@ class FieldAccessor(tuple, Generic[T]):
         return self[self._field_idx_map[name]]
 
 
+@functools.lru_cache(maxsize=None)
 def fields(
     cls: Type[T],
 ) -> Union[FieldAccessor[T], Type[T]]:
+    # the fields of a class do not change once it is created
     return FieldAccessor(cls)
 
 
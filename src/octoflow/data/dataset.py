@@ -6,6 +6,7 @@ import shutil
 import tempfile
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Generator,
@@ -21,7 +22,6 @@ from typing import (
 
 import numpy as np
 import pandas as pd
-import polars as pl
 import pyarrow as pa
 from numpy.typing import ArrayLike
 from pandas import DataFrame
@@ -32,11 +32,14 @@ from octoflow import logging
 from octoflow.data.base import DEFAULT_BATCH_SIZE, DEFAULT_FORMAT, BaseDataset
 from octoflow.data.dataclass import BaseModel, field
 from octoflow.data.expression import Expression
-from octoflow.data.loaders import DatasetLoader, loaders
+from octoflow.data.loaders import DatasetLoader, get_loader
 from octoflow.data.schema import get_schema, get_schema_from_dataclass
 from octoflow.utils import hashing
 from octoflow.utils.cache import cache
 
+if TYPE_CHECKING:
+    import polars as pl
+
 logger = logging.get_logger(__name__)
 
 SourceType = Union[
@@ -125,7 +128,7 @@ class Dataset(BaseDataset):  # noqa: PLR0904
                 as the first argument.
         """  # noqa: E501
         if isinstance(data_or_loader, str):
-            data_or_loader = loaders[data_or_loader]
+            data_or_loader = get_loader(data_or_loader)
         if isinstance(data_or_loader, DatasetLoader):
             if loader_args is None:
                 loader_args = ()
@@ -146,10 +149,10 @@ class Dataset(BaseDataset):  # noqa: PLR0904
             format = DEFAULT_FORMAT
         state = write_dataset(path, data, schema=schema, format=format)
         if not state:
-            msg = (
-                f"existing dataset found at '{path}', loading existing file(s)"
+            logger.warning(
+                "existing dataset found at '%s', loading existing file(s)",
+                path,
             )
-            logger.warning(msg)
         dataset = read_dataset(path, format=format)
         super().__init__(dataset)
         self._path = path
@@ -412,8 +415,8 @@ class Dataset(BaseDataset):  # noqa: PLR0904
         state = write_dataset(path, batch_iter, format=self.format)
         if not state:
             logger.warning(
-                f"existing dataset found at '{path}', "
-                "loading existing file(s)"
+                "existing dataset found at '%s', loading existing file(s)",
+                path,
             )
         if progress_bar is not None:
             progress_bar.update(num_steps)
@@ -451,8 +454,8 @@ class Dataset(BaseDataset):  # noqa: PLR0904
         )
         if not state:
             logger.warning(
-                f"existing dataset found at '{path}', "
-                "loading existing file(s)"
+                "existing dataset found at '%s', loading existing file(s)",
+                path,
             )
         return type(self).load_dataset(
             path,
@@ -547,8 +550,8 @@ class Dataset(BaseDataset):  # noqa: PLR0904
         state = write_dataset(path, scanner, format=self.format)
         if not state:
             logger.warning(
-                f"existing dataset found at '{path}', "
-                "loading existing file(s)"
+                "existing dataset found at '%s', loading existing file(s)",
+                path,
             )
         return type(self).load_dataset(
             path,
@@ -594,6 +597,9 @@ class Dataset(BaseDataset):  # noqa: PLR0904
         pl.LazyFrame
             The Polars Lazy DataFrame.
         """
+        # polars is slow to import and only needed here
+        import polars as pl  # noqa: PLC0415
+
         return pl.scan_ipc(self.path / "data" / "*.arrow")
 
 
@@ -618,11 +624,12 @@ def gen_unique_cached_path(
     except Exception as e:
         path = Path(tempfile.mkdtemp(dir=cache_dir))
         # an error occurred while hashing data
-        msg = (
-            f"Using temporary directory: {path}; "
-            f"Failed to create unique path due to the following error: {e}."
+        logger.warning(
+            "Using temporary directory: %s; "
+            "Failed to create unique path due to the following error: %s.",
+            path,
+            e,
         )
-        logger.warning(msg)
     return path
 
 
@@ -639,13 +646,18 @@ def writable(
         # data must be a generator of RecordBatch
         return pa.RecordBatchReader.from_batches(schema, data)
     if isinstance(data, pa.Table):
+        if schema is None:
+            # stream the batches of the table instead of handing it over
+            return data.to_reader()
         return data
     if isinstance(data, pd.DataFrame):
         return pa.RecordBatch.from_pandas(data, schema=schema)
     if isinstance(data, Mapping):
         return pa.RecordBatch.from_pydict(data, schema=schema)
     if isinstance(data, Sequence) and not isinstance(data, str):
-        return pa.RecordBatch.from_pylist(list(data), schema=schema)
+        if not isinstance(data, list):
+            data = list(data)
+        return pa.RecordBatch.from_pylist(data, schema=schema)
     dtype = data.__class__.__name__
     msg = (
         f"expected data to be of type 'pa.RecordBatch', 'pa.Table', "
@@ -707,7 +719,7 @@ def to_batches(
     elif isinstance(data, pa.RecordBatchReader):
         yield from data
     elif isinstance(data, pa.Table):
-        yield from data.to_batches()
+        yield from data.to_reader()
     else:
         for item in data:
             yield from to_batches(item)
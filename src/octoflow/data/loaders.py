@@ -3,6 +3,8 @@ from __future__ import annotations
 import functools
 import glob
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import (
     Any,
@@ -23,6 +25,11 @@ from octoflow import logging
 from octoflow.data.base import BaseDatasetLoader
 from octoflow.utils import func
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.get_logger(__name__)
 
 P = ParamSpec("P")
@@ -33,6 +40,8 @@ loaders: Dict[str, DatasetLoader] = {}
 
 
 class DatasetLoader(BaseDatasetLoader):
+    __slots__ = ("extensions", "func", "name", "path_arg", "wraps")
+
     def __init__(
         self,
         func: Callable[..., Any],
@@ -233,6 +242,66 @@ def dataloader(
     return func
 
 
+def get_loader(name: str) -> DatasetLoader:
+    """
+    Get a registered dataset loader by name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the loader.
+
+    Returns
+    -------
+    DatasetLoader
+        The dataset loader.
+
+    Raises
+    ------
+    ValueError
+        If no loader is registered with the given name.
+    """
+    try:
+        return loaders[name]
+    except KeyError:
+        msg = f"loader '{name}' not found"
+        raise ValueError(msg) from None
+
+
+def _read_json(path: str, encoding: str = "utf-8") -> Any:
+    """
+    Parse a JSON file, mapping it into memory when orjson is available.
+
+    Parameters
+    ----------
+    path : str
+        The path to the file.
+    encoding : str, optional
+        The encoding of the file, by default "utf-8".
+
+    Returns
+    -------
+    Any
+        The parsed JSON document.
+    """
+    # orjson only decodes UTF-8 and mmap cannot map empty files
+    if (
+        orjson is not None
+        and encoding.lower().replace("-", "") == "utf8"
+        and os.path.getsize(path) > 0
+    ):
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm, memoryview(mm) as buffer:
+            try:
+                return orjson.loads(buffer)
+            except orjson.JSONDecodeError:
+                # e.g., NaN and Infinity are only accepted by json
+                pass
+    with open(path, encoding=encoding) as f:
+        return json.load(f)
+
+
 @dataloader(name="json", extensions=[".json"], path_arg="path")
 def load_json(
     path: Union[str, Path], encoding: str = "utf-8"
@@ -252,14 +321,12 @@ def load_json(
     dict
         The loaded dataset.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    if path.is_dir():
+    path = os.fspath(path)
+    if os.path.isdir(path):
         logger.info("loading all .json files in the directory '%s'", path)
-        path /= "*.json"
-    for p in glob.iglob(str(path)):
-        with open(p, encoding=encoding) as f:
-            yield json.load(f)
+        path = os.path.join(path, "*.json")
+    for p in glob.iglob(path):
+        yield _read_json(p, encoding=encoding)
 
 
 @dataloader(
@@ -285,15 +352,13 @@ def load_jsonl(
     list[dict]
         The loaded dataset.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    logger.debug(
-        "Is the provided path '%s' a directory? %s", path, path.is_dir()
-    )
-    if path.is_dir():
+    path = os.fspath(path)
+    is_dir = os.path.isdir(path)
+    logger.debug("Is the provided path '%s' a directory? %s", path, is_dir)
+    if is_dir:
         logger.info("Loading all .jsonl files in the directory '%s'", path)
-        path /= "*.jsonl"
-    for p in glob.iglob(str(path)):
+        path = os.path.join(path, "*.jsonl")
+    for p in glob.iglob(path):
         with open(p, encoding=encoding) as f:
             yield [json.loads(line) for line in f]
 
@@ -322,14 +387,12 @@ def load_csv(
     list[dict]
         The loaded dataset.
     """
-    if isinstance(path, str):
-        path = Path(path)
-    if path.is_dir():
+    path = os.fspath(path)
+    if os.path.isdir(path):
         logger.info("loading all .csv files in the directory '%s'", path)
-        path /= "*.csv"
-    for p in glob.iglob(str(path)):
-        p = Path(p)
-        if p.suffix == ".tsv":
+        path = os.path.join(path, "*.csv")
+    for p in glob.iglob(path):
+        if p.endswith(".tsv"):
             return pd.read_csv(p, sep="\t", encoding=encoding).to_dict(
                 orient="records"
             )
@@ -8,10 +8,10 @@ __all__ = [
 def unify_metadata(left: Any, right: Any) -> Optional[dict]:
     # merge metadata left then right
     #   (right metadata will overwrite left metadata)
-    metadata = left.metadata
-    if metadata is None:
-        metadata = right.metadata
-    elif right.metadata is not None:
-        # metadata and right.metadata are not None
-        metadata = {**metadata, **right.metadata}
-    return metadata
+    left_metadata, right_metadata = left.metadata, right.metadata
+    if not right_metadata:
+        # nothing to overwrite with - avoid copying the left metadata
+        return left_metadata if left_metadata is not None else right_metadata
+    if not left_metadata:
+        return right_metadata
+    return {**left_metadata, **right_metadata}
@@ -1,4 +1,4 @@
-from typing import Mapping, Sequence
+from typing import Dict, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
@@ -12,14 +12,36 @@ class Sampler:
     def __init__(self, columns: Mapping[str, int]):
         self.args = (0, *list(columns.values()))
         self.columns = list(columns.keys())
+        # slice bounds are computed once so that each call only slices
+        self._bounds = list(zip(self.args[:-1], self.args[1:]))
 
-    def __call__(self, lst: Sequence[int]):
+    def __call__(self, lst: Sequence[int]) -> pd.Series:
         lst = np.array(lst)
         np.random.shuffle(lst)
         return pd.Series(
-            [
-                lst[self.args[i] : self.args[i + 1]]
-                for i in range(len(self.args) - 1)
-            ],
+            [lst[start:stop] for start, stop in self._bounds],
             index=self.columns,
         )
+
+    def sample_dict(self, lst: Sequence[int]) -> Dict[str, np.ndarray]:
+        """
+        Shuffle the items and slice them into columns.
+
+        Unlike calling the sampler, no pandas Series is built.
+
+        Parameters
+        ----------
+        lst : Sequence[int]
+            The items to sample from.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            The sample keyed by column name.
+        """
+        lst = np.array(lst)
+        np.random.shuffle(lst)
+        return {
+            column: lst[start:stop]
+            for column, (start, stop) in zip(self.columns, self._bounds)
+        }
@@ -1,8 +1,8 @@
 import functools
 import itertools
-from contextlib import suppress
-from typing import Any, Dict, Generator, Optional, Tuple, TypeVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
 
+import numpy as np
 import pyarrow as pa
 from typing_extensions import Self
 
@@ -19,63 +19,73 @@ __all__ = [
 T = TypeVar("T")
 
 
+def _unify_fields(this_field: pa.Field, other_field: pa.Field) -> pa.Field:
+    name = other_field.name
+    this_type, other_type = this_field.type, other_field.type
+    if this_type.equals(other_type):
+        promoted_type = this_type
+    else:
+        try:
+            promoted_type = unify_types(this_type, other_type)
+        except ValueError as ex:
+            msg = (
+                f"cannot unify types '{this_type}' and "
+                f"'{other_type}' of field '{name}'"
+            )
+            raise ValueError(msg) from ex
+    nullable = (
+        this_field.nullable
+        or other_field.nullable
+        or pa.types.is_null(this_type)
+        or pa.types.is_null(other_type)
+    )
+    if (
+        promoted_type is this_type
+        and nullable == this_field.nullable
+        and not other_field.metadata
+    ):
+        # nothing changed - reuse the existing field
+        return this_field
+    metadata = unify_metadata(this_field, other_field)
+    return pa.field(name, promoted_type, nullable, metadata)
+
+
+def _read_schema(schema_bytes: bytes) -> pa.Schema:
+    return pa.ipc.read_schema(pa.py_buffer(schema_bytes))
+
+
 def unify_schemas(this: pa.Schema, other: Optional[pa.Schema]) -> pa.Schema:
-    if other is None:
+    if other is None or this.equals(other, check_metadata=True):
+        # identical schemas (compared by Arrow) unify to themselves
         return this
-    _fields = {}
-    this_schema_fields = set()
-    for this_field in this:
-        this_field_name = this_field.name
-        _fields[this_field.name] = pa.field(
-            this_field.name,
-            this_field.type,
-            this_field.nullable,
-            this_field.metadata,
-        )
-        this_schema_fields.add(this_field_name)
-    for other_field in other:
-        other_field_name = other_field.name
-        this_schema_fields.discard(other_field_name)
-        if other_field_name in _fields:
-            this_field = _fields[other_field_name]
-            try:
-                promoted_type = unify_types(this_field.type, other_field.type)
-            except ValueError as ex:
-                msg = (
-                    f"cannot unify types '{this_field.type}' and "
-                    f"'{other_field.type}' of field '{other_field_name}'"
-                )
-                raise ValueError(msg) from ex
-            nullable = (
-                this_field.nullable
-                or this_field.type.equals(pa.null())
-                or other_field.nullable
-                or other_field.type.equals(pa.null())
-            )
-            metadata = unify_metadata(this_field, other_field)
-            _fields[other_field_name] = pa.field(
-                other_field_name,
-                promoted_type,
-                nullable,
-                metadata,
-            )
+    # schemas are not hashable - use their serialized form as the cache key
+    return _unify_serialized_schemas(
+        this.serialize().to_pybytes(), other.serialize().to_pybytes()
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _unify_serialized_schemas(
+    this_bytes: bytes, other_bytes: bytes
+) -> pa.Schema:
+    this, other = _read_schema(this_bytes), _read_schema(other_bytes)
+    this_fields = {this_field.name: this_field for this_field in this}
+    other_fields = {other_field.name: other_field for other_field in other}
+    fields = []
+    # single pass over the names of both schemas (in order of appearance)
+    for name in dict.fromkeys(this.names + other.names):
+        this_field = this_fields.get(name)
+        other_field = other_fields.get(name)
+        if this_field is None or other_field is None:
+            # fields that are not in both schemas are nullable
+            field = other_field if this_field is None else this_field
+            if not field.nullable:
+                field = field.with_nullable(True)
+            fields.append(field)
         else:
-            _fields[other_field_name] = pa.field(
-                other_field_name,
-                other_field.type,
-                True,  # nullable because this field is not in the existing
-                other_field.metadata,
-            )
-    for this_field_name in this_schema_fields:
-        this_field = _fields[this_field_name]
-        _fields[this_field_name] = pa.field(
-            this_field_name,
-            this_field.type,
-            True,  # nullable because this field is not in the other schema
-            this_field.metadata,
-        )
+            fields.append(_unify_fields(this_field, other_field))
     metadata = unify_metadata(this, other)
-    return pa.schema(list(_fields.values()), metadata=metadata)
+    return pa.schema(fields, metadata=metadata)
 
 
 def infer_schema(
@@ -89,6 +99,45 @@ def infer_schema(
     return pa.schema(list(_fields.values()), metadata=metadata)
 
 
+def _make_predicate(data_type: pa.DataType) -> Optional[Callable[[Any], bool]]:
+    # predicates only accept values that PyArrow is known to convert
+    if pa.types.is_integer(data_type):
+        info = np.iinfo(data_type.to_pandas_dtype())
+        low, high = int(info.min), int(info.max)
+        return lambda value: type(value) is int and low <= value <= high
+    if pa.types.is_float64(data_type):
+        return lambda value: type(value) is float
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return lambda value: type(value) is str
+    if pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type):
+        return lambda value: type(value) is bytes
+    if pa.types.is_boolean(data_type):
+        return lambda value: type(value) is bool
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _make_validator(schema_bytes: bytes) -> Optional[Callable[[dict], bool]]:
+    schema = _read_schema(schema_bytes)
+    checks = []
+    for field in schema:
+        predicate = _make_predicate(field.type)
+        if predicate is None:
+            # e.g., nested types - always validate with PyArrow
+            return None
+        checks.append((field.name, predicate))
+
+    def is_valid(data: dict) -> bool:
+        for name, predicate in checks:
+            value = data.get(name)
+            # missing and null values are not checked by PyArrow either
+            if value is not None and not predicate(value):
+                return False
+        return True
+
+    return is_valid
+
+
 def validate(schema: pa.Schema, data: dict) -> bool:
     """
     Validates a dictionary against a PyArrow schema.
@@ -116,6 +165,10 @@ def validate(schema: pa.Schema, data: dict) -> bool:
     ...
     ValidationError: ...
     """  # noqa: E501
+    is_valid = _make_validator(schema.serialize().to_pybytes())
+    if is_valid is not None and is_valid(data):
+        return
+    # build a record batch to get the error (if any) raised by PyArrow
     try:
         pa.RecordBatch.from_pylist([data], schema)
     except pa.lib.ArrowInvalid as e:
@@ -124,34 +177,37 @@ def validate(schema: pa.Schema, data: dict) -> bool:
 
 def get_schema(data: T) -> Tuple[T, pa.Schema]:
     """
-    Extracts the schema from a PyArrow schema or a generator of PyArrow
+    Extracts the schema from a PyArrow schema or an iterator of PyArrow
     record batches.
 
     Parameters
     ----------
     data : Any
-        The PyArrow schema or generator of record batches.
+        The PyArrow schema or iterator of record batches.
 
     Returns
     -------
     Tuple[Any, pa.Schema]
         The data and the schema.
     """
-    with suppress(AttributeError):
-        return data, data.schema
-    if isinstance(data, Generator):
-        data, _data = itertools.tee(data)
+    schema = getattr(data, "schema", None)
+    if schema is not None:
+        return data, schema
+    if isinstance(data, Iterator):
+        # peek the first batch and put it back in front of the stream
         try:
-            return data, next(_data).schema
+            first = next(data)
         except StopIteration:
-            return data, pa.schema([])
+            return iter(()), pa.schema([])
+        return itertools.chain([first], data), first.schema
     msg = (
-        "expected data to be of type 'Generator', "
+        "expected data to be of type 'Iterator', "
         f"got '{data.__class__.__name__}'"
     )
     raise TypeError(msg)
 
 
+@functools.lru_cache(maxsize=None)
 def from_dataclass(cls: T) -> pa.Schema:
     """
     Converts a dataclass to a PyArrow schema.
@@ -178,9 +234,7 @@ def from_dataclass(cls: T) -> pa.Schema:
     """
     fields = []
     for field in cls.__dataclass_fields__.values():
-        nullable = True
-        if hasattr(field, "nullable"):
-            nullable = field.nullable
+        nullable = getattr(field, "nullable", True)
         fields.append(
             pa.field(
                 field.name,
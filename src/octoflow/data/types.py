@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import typing
 from dataclasses import is_dataclass
-from typing import Any, NamedTuple, Union
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
@@ -44,19 +45,21 @@ class Undefined(pa.ExtensionType):
         return Undefined()
 
 
-def undefined() -> Undefined:
-    return Undefined()
+UNDEFINED = Undefined()
 
+pa.register_extension_type(UNDEFINED)
 
-UNDEFINED = undefined()
 
-pa.register_extension_type(UNDEFINED)
+def undefined() -> Undefined:
+    return UNDEFINED
 
 
 def is_undefined(obj: pa.DataType) -> bool:
-    return UNDEFINED.equals(obj)
+    # instances other than UNDEFINED come from deserialization
+    return obj is UNDEFINED or isinstance(obj, Undefined)
 
 
+@functools.lru_cache(maxsize=None)
 def from_dataclass(cls: type) -> pa.DataType:
     """Return the PyArrow data type of a dataclass.
 
@@ -73,9 +76,7 @@ def from_dataclass(cls: type) -> pa.DataType:
     fields = {}
     for field_name, field_type in typing.get_type_hints(cls).items():
         f = cls.__dataclass_fields__[field_name]
-        nullable = True
-        if hasattr(f, "nullable"):
-            nullable = f.nullable
+        nullable = getattr(f, "nullable", True)
         fields[field_name] = pa.field(
             field_name,
             from_dtype(field_type),
@@ -85,6 +86,7 @@ def from_dataclass(cls: type) -> pa.DataType:
     return pa.struct(fields)
 
 
+@functools.lru_cache(maxsize=None)
 def from_typed_dict(cls: _TypedDictMeta) -> pa.DataType:
     """Return the PyArrow data type of a TypedDict.
 
@@ -129,6 +131,15 @@ def from_dtype(dtype: Union[type, np.dtype, None]) -> pa.DataType:
     pa.DataType
         The PyArrow data type.
     """
+    try:
+        hash(dtype)
+    except TypeError:
+        # unhashable data types cannot be cached
+        return _from_dtype(dtype)
+    return _cached_from_dtype(dtype)
+
+
+def _from_dtype(dtype: Union[type, np.dtype, None]) -> pa.DataType:
     type_args = typing.get_args(dtype)
     dtype = typing.get_origin(dtype) or dtype
     # null
@@ -180,6 +191,59 @@ def from_dtype(dtype: Union[type, np.dtype, None]) -> pa.DataType:
         raise ValueError(msg) from ex
 
 
+_cached_from_dtype = functools.lru_cache(maxsize=1024)(_from_dtype)
+
+
+def _promote_types(left: pa.DataType, right: pa.DataType) -> pa.DataType:
+    """Return the PyArrow data type NumPy promotes left and right to.
+
+    Parameters
+    ----------
+    left : pa.DataType
+        The left PyArrow data type.
+    right : pa.DataType
+        The right PyArrow data type.
+
+    Returns
+    -------
+    pa.DataType
+        The PyArrow data type.
+    """
+    dtype = np.promote_types(left.to_pandas_dtype(), right.to_pandas_dtype())
+    try:
+        return from_dtype(dtype)
+    except ValueError as ex:
+        msg = f"cannot unify types '{left}' and '{right}'"
+        raise ValueError(msg) from ex
+
+
+def _build_promoted_types() -> Dict[Tuple[int, int], pa.DataType]:
+    # only parameter-free types, which are fully identified by their id
+    scalar_types = [
+        pa.bool_(),
+        pa.int8(),
+        pa.int16(),
+        pa.int32(),
+        pa.int64(),
+        pa.uint8(),
+        pa.uint16(),
+        pa.uint32(),
+        pa.uint64(),
+        pa.float16(),
+        pa.float32(),
+        pa.float64(),
+    ]
+    promoted_types = {}
+    for left in scalar_types:
+        for right in scalar_types:
+            promoted_types[left.id, right.id] = _promote_types(left, right)
+    return promoted_types
+
+
+# promotion table of the common scalar types keyed by their type ids
+_PROMOTED_TYPES = _build_promoted_types()
+
+
 def _is_compatible(
     op: callable, left: pa.DataType, right: pa.DataType
 ) -> bool:
@@ -223,82 +287,176 @@ def unify_types(left: pa.DataType, right: pa.DataType) -> pa.DataType:
     pa.DataType
         The PyArrow data type.
     """
+    # identical (possibly nested) types need no further unification
+    if left is right or left.equals(right):
+        return left
     if is_undefined(left) or pa.types.is_null(left):
         return right
     if is_undefined(right) or pa.types.is_null(right):
         return left
-    if left.equals(right):
-        return left
     if _is_compatible(pa.types.is_list, left, right):
         left_field, right_field = left.field(0), right.field(0)
+        left_value_type, right_value_type = left_field.type, right_field.type
         nullable = (
             left_field.nullable
-            or left.value_type.equals(pa.null())
             or right_field.nullable
-            or right.value_type.equals(pa.null())
+            or pa.types.is_null(left_value_type)
+            or pa.types.is_null(right_value_type)
         )
+        value_type = unify_types(left_value_type, right_value_type)
+        if (
+            value_type is left_value_type
+            and nullable == left_field.nullable
+            and not right_field.metadata
+        ):
+            # nothing changed - reuse the left type
+            return left
         metadata = unify_metadata(left_field, right_field)
-        return pa.list_(
-            pa.field(
-                "item",
-                unify_types(left.value_type, right.value_type),
-                nullable,
-                metadata,
-            )
-        )
+        return pa.list_(pa.field("item", value_type, nullable, metadata))
     if _is_compatible(pa.types.is_struct, left, right):
-        fields = {}
-        # there may be fields that are in left but not in right
-        #   those fields are optional i.e., nullable fields
-        left_only_fields = set()
+        # unified fields in order and the position of each field by name
+        fields, index = [], {}
         for left_field in left:
-            fields[left_field.name] = left_field
-            left_only_fields.add(left_field.name)
+            i = index.setdefault(left_field.name, len(fields))
+            if i == len(fields):
+                fields.append(left_field)
+            else:
+                fields[i] = left_field
         for right_field in right:
             right_field_name = right_field.name
-            left_only_fields.discard(right_field_name)
-            if right_field_name in fields:
+            i = index.get(right_field_name)
+            if i is not None:
                 # existing field - promote the type
-                left_field = fields[right_field_name]
+                left_field = fields[i]
                 nullable = (
                     left_field.nullable
-                    or left_field.type.equals(pa.null())
                     or right_field.nullable
-                    or right_field.type.equals(pa.null())
+                    or pa.types.is_null(left_field.type)
+                    or pa.types.is_null(right_field.type)
                 )
+                left_type = left_field.type
                 try:
-                    promoted_type = unify_types(
-                        left_field.type, right_field.type
-                    )
+                    promoted_type = unify_types(left_type, right_field.type)
                 except ValueError as ex:
                     msg = (
-                        f"cannot unify types '{left_field.type}' and "
+                        f"cannot unify types '{left_type}' and "
                         f"'{right_field.type}' of field '{right_field_name}'"
                     )
                     raise ValueError(msg) from ex
+                if (
+                    promoted_type is left_type
+                    and nullable == left_field.nullable
+                    and not right_field.metadata
+                ):
+                    # nothing changed - keep the left field
+                    continue
                 metadata = unify_metadata(left_field, right_field)
-                fields[right_field_name] = pa.field(
+                fields[i] = pa.field(
                     right_field_name, promoted_type, nullable, metadata
                 )
             else:
                 # new field (right only) is nullable
-                fields[right_field_name] = right_field.with_nullable(True)
-        # replace the left only fields with nullable fields
+                if not right_field.nullable:
+                    right_field = right_field.with_nullable(True)
+                index[right_field_name] = len(fields)
+                fields.append(right_field)
+        # there may be fields that are in left but not in right
+        #   those fields are optional i.e., nullable fields
+        left_only_fields = index.keys() - {field.name for field in right}
         for left_field_name in left_only_fields:
-            left_field = fields[left_field_name]
-            if left_field.nullable:
+            i = index[left_field_name]
+            if fields[i].nullable:
                 # already nullable
                 continue
-            fields[left_field_name] = left_field.with_nullable(True)
-        fields = list(fields.values())
+            fields[i] = fields[i].with_nullable(True)
         return pa.struct(fields)
     # for any other types, use the NumPy data type
-    dtype = np.promote_types(left.to_pandas_dtype(), right.to_pandas_dtype())
-    try:
-        return from_dtype(dtype)
-    except ValueError as ex:
-        msg = f"cannot unify types '{left}' and '{right}'"
-        raise ValueError(msg) from ex
+    promoted_type = _PROMOTED_TYPES.get((left.id, right.id))
+    if promoted_type is not None:
+        return promoted_type
+    return _promote_types(left, right)
+
+
+# kinds of NumPy arrays that can be inferred from their smallest and largest
+#   item, keyed by the (only) type of the items in a list
+_HOMOGENEOUS_ITEM_KINDS = {bool: "b", int: "iu", float: "f"}
+
+
+def _infer_homogeneous_item_type(obj: list) -> Optional[pa.DataType]:
+    """Return the item type of a list of only int, float or bool values.
+
+    The result matches unifying the minimal scalar type of every item, which
+    for numbers of a single kind is decided by the smallest and the largest
+    item.
+
+    Parameters
+    ----------
+    obj : list
+        The list.
+
+    Returns
+    -------
+    pa.DataType | None
+        The PyArrow data type of the items or None if the list is not a
+        homogeneous list of numbers.
+    """
+    item_types = set(map(type, obj))
+    if len(item_types) != 1:
+        return None
+    kinds = _HOMOGENEOUS_ITEM_KINDS.get(item_types.pop())
+    if kinds is None:
+        return None
+    array = np.asarray(obj)
+    if array.dtype.kind not in kinds:
+        # e.g., integers that do not fit in a single 64 bit integer type
+        return None
+    if array.dtype.kind == "f" and not np.isfinite(array).all():
+        # NaN and infinity would hide the smallest and the largest items
+        return None
+    dtype = np.promote_types(
+        np.min_scalar_type(array.min()),
+        np.min_scalar_type(array.max()),
+    )
+    return pa.from_numpy_dtype(dtype)
+
+
+# PyArrow types of Python scalars whose type does not depend on their value
+_SCALAR_TYPES = {bool: pa.bool_(), str: pa.string(), bytes: pa.binary()}
+
+# bounds of the integer types in the order np.min_scalar_type picks them
+_UNSIGNED_INT_BOUNDS = tuple(
+    (int(np.iinfo(dtype).max), pa.from_numpy_dtype(dtype))
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64)
+)
+_SIGNED_INT_BOUNDS = tuple(
+    (int(np.iinfo(dtype).min), pa.from_numpy_dtype(dtype))
+    for dtype in (np.int8, np.int16, np.int32, np.int64)
+)
+
+
+def _infer_int_type(value: int) -> Optional[pa.DataType]:
+    """Return the PyArrow type of the smallest integer type holding value.
+
+    Parameters
+    ----------
+    value : int
+        The integer.
+
+    Returns
+    -------
+    pa.DataType or None
+        The same type as `np.min_scalar_type` would give, or None if value
+        does not fit in a 64-bit integer.
+    """
+    if value >= 0:
+        for high, data_type in _UNSIGNED_INT_BOUNDS:
+            if value <= high:
+                return data_type
+    else:
+        for low, data_type in _SIGNED_INT_BOUNDS:
+            if value >= low:
+                return data_type
+    return None
 
 
 def infer_type(obj: Any) -> pa.DataType:
@@ -314,6 +472,14 @@ def infer_type(obj: Any) -> pa.DataType:
     pa.DataType
         The PyArrow data type.
     """
+    obj_type = type(obj)
+    data_type = _SCALAR_TYPES.get(obj_type)
+    if data_type is not None:
+        return data_type
+    if obj_type is int:
+        data_type = _infer_int_type(obj)
+        if data_type is not None:
+            return data_type
     try:
         if not np.isscalar(obj):
             # e.g., list, dict, etc.
@@ -323,11 +489,14 @@ def infer_type(obj: Any) -> pa.DataType:
     except NotImplementedError:
         pass
     if isinstance(obj, list):
+        item_type = _infer_homogeneous_item_type(obj)
+        if item_type is not None:
+            return pa.list_(pa.field("item", item_type, False))
         item_type = undefined()
         nullable = False
         for item in obj:
             current_item_type = infer_type(item)
-            if not nullable and current_item_type.equals(pa.null()):
+            if not nullable and pa.types.is_null(current_item_type):
                 nullable = True
             if is_undefined(item_type):
                 item_type = current_item_type
@@ -339,7 +508,7 @@ def infer_type(obj: Any) -> pa.DataType:
         fields = {}
         for key, value in obj.items():
             value_type = infer_type(value)
-            nullable = value_type.equals(pa.null())
+            nullable = pa.types.is_null(value_type)
             value_field = pa.field(key, value_type, nullable)
             fields[key] = value_field
         fields = list(fields.values())
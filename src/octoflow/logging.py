@@ -1,4 +1,9 @@
+import atexit
+import functools
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Union
 
 try:
@@ -9,6 +14,8 @@ except ImportError:
 __all__ = [
     "get_logger",
     "set_level",
+    "start_queue_listener",
+    "stop_queue_listener",
 ]
 
 logger: logging.Logger
@@ -23,6 +30,81 @@ DEBUG = logging.DEBUG
 NOTSET = logging.NOTSET
 
 
+# console output is written synchronously unless the queue listener is
+#   started, records are then written by a background thread so that
+#   logging does not block on terminal I/O
+_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=16)
+def _make_formatter(fmt: Optional[str]) -> logging.Formatter:
+    # formatters hold no per-logger state and can be shared
+    return logging.Formatter(fmt)
+
+
+def _make_console_handler() -> logging.Handler:
+    if RichHandler is None:
+        handler = logging.StreamHandler()
+    else:
+        handler = RichHandler(
+            show_time=False,
+            show_level=False,
+            show_path=False,
+        )
+    handler.setLevel(logging.DEBUG)
+    return handler
+
+
+class _ConsoleHandler(QueueHandler):
+    def __init__(self) -> None:
+        super().__init__(_QUEUE)
+        # writes the records while no queue listener is running
+        self.console = _make_console_handler()
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:  # noqa: N802
+        super().setFormatter(fmt)
+        self.console.setFormatter(fmt)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _LISTENER is None:
+            # the raw record keeps its exc_info (e.g., for rich tracebacks)
+            self.console.handle(record)
+            return
+        # the record is formatted by this handler before it is queued
+        super().emit(record)
+
+
+def start_queue_listener() -> None:
+    """Write log records to the console from a background thread.
+
+    The listener is stopped by `stop_queue_listener` or at exit.
+    """
+    global _LISTENER  # noqa: PLW0603
+    with _LISTENER_LOCK:
+        if _LISTENER is not None:
+            return
+        listener = QueueListener(_QUEUE, _make_console_handler())
+        listener.start()
+        _LISTENER = listener
+    atexit.register(stop_queue_listener)
+
+
+def stop_queue_listener() -> None:
+    """Stop the queue listener and write log records synchronously again.
+
+    Records that are already queued are written before this returns.
+    """
+    global _LISTENER  # noqa: PLW0603
+    with _LISTENER_LOCK:
+        listener = _LISTENER
+        _LISTENER = None
+    if listener is not None:
+        listener.stop()
+    atexit.unregister(stop_queue_listener)
+
+
 def get_logger(
     name: Optional[str] = None,
     level: Union[int, str, None] = None,
@@ -50,18 +132,14 @@ def get_logger(
     logger = logging.getLogger(name)
     if level is not None:
         logger.setLevel(level)
-    if RichHandler is None:
-        handler = logging.StreamHandler()
-    else:
-        handler = RichHandler(
-            show_time=False,
-            show_level=False,
-            show_path=False,
-        )
+    if logger.handlers:
+        # already configured - adding another handler would duplicate output
+        return logger
+    handler = _ConsoleHandler()
     handler.setLevel(logging.DEBUG)
     if not isinstance(formatter, logging.Formatter):
         # Create a formatter
-        formatter = logging.Formatter(formatter)
+        formatter = _make_formatter(formatter)
     # add it to the handlers
     handler.setFormatter(formatter)
     # Add the handlers to the logger
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import abc
 import json
+import os
 import shutil
+import threading
 import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Type, Union
+from typing import Any, Dict, Generator, List, Tuple, Type, Union
 
 from octoflow.utils.collections import MutableDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _handler_types: Dict[str, Type[ArtifactHandler]] = {}
 
 
@@ -40,6 +48,42 @@ def list_handler_types() -> List[str]:
     return list(_handler_types.keys())
 
 
+# path -> ((mtime_ns, size), data) of recently read metadata files
+_metadata_cache: OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = (
+    OrderedDict()
+)
+_METADATA_CACHE_SIZE = 256
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g., NaN and Infinity are only accepted by json
+            pass
+    return json.loads(data)
+
+
+def _read_metadata(path: str, stat: os.stat_result) -> Dict[str, Any]:
+    # files changed on disk (by another process) are read again
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _METADATA_CACHE_LOCK:
+        cached = _metadata_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            _metadata_cache.move_to_end(path)
+            return cached[1]
+    # the file is read and parsed without holding the lock
+    data = _loads(Path(path).read_bytes())
+    with _METADATA_CACHE_LOCK:
+        _metadata_cache[path] = (stamp, data)
+        _metadata_cache.move_to_end(path)
+        while len(_metadata_cache) > _METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+    return data
+
+
 class ArtifactMetadata(MutableDict[str, Any]):
     def __init__(self, handler: ArtifactHandler) -> None:
         self.handler_ref = weakref.ref(handler)
@@ -52,15 +96,23 @@ class ArtifactMetadata(MutableDict[str, Any]):
 
     def _on_change(self) -> Generator[Dict[str, Any], None, None]:
         path = self.handler.path / ".metadata.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f)
+        # encode up front so the file is written in one call rather than
+        #   one call per chunk produced by json.dump
+        path.write_text(json.dumps(self._data), encoding="utf-8")
+        # the file may change within the resolution of its mtime
+        with _METADATA_CACHE_LOCK:
+            _metadata_cache.pop(os.fspath(path), None)
 
     def _load_data(self) -> Dict[str, Any]:
-        path = self.handler.path / ".metadata.json"
-        if not path.exists():
+        path = os.fspath(self.handler.path / ".metadata.json")
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
             return {}
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        data = _read_metadata(path, stat)
+        # copy so that changes to this instance do not leak into the cache
+        #   (nested containers are copied when coerced by MutableDict)
+        return dict(data)
 
 
 class ArtifactHandlerType(abc.ABCMeta):
@@ -164,9 +216,11 @@ class ArtifactHandler(metaclass=ArtifactHandlerType):
             None
         """
         path = Path(self.path)
-        if not path.exists():
+        try:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        except FileNotFoundError:
+            # already deleted
             return
-        if path.is_dir():
-            shutil.rmtree(path)
-        else:
-            path.unlink()
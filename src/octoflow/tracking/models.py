@@ -4,10 +4,15 @@ import copy
 import datetime as dt
 import os
 from collections import UserDict, defaultdict
+from contextlib import contextmanager
 from dataclasses import field
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
+    Generator,
+    ItemsView,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -15,6 +20,7 @@ from typing import (
     Optional,
     Tuple,
     Union,
+    ValuesView,
 )
 
 from typing_extensions import Self
@@ -23,11 +29,15 @@ from octoflow.tracking import store
 from octoflow.tracking.store import (
     StoredModel,
     TrackingStore,
+    ValueMapping,
     ValueType,
     VariableType,
 )
 from octoflow.utils.collections import flatten
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 __all__ = [
     "Experiment",
     "Run",
@@ -38,6 +48,8 @@ __all__ = [
 
 JSONType = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 
+DEFAULT_FLUSH_THRESHOLD = 1000
+
 
 class TrackingClient:
     def __init__(self, store: TrackingStore) -> None:
@@ -135,6 +147,14 @@ class TagsMapping(MutableMapping[str, JSONType]):
         for key, _ in self.data.items():
             yield key
 
+    # items and values are read with a single query instead of one query
+    #   per key through __getitem__
+    def items(self) -> ItemsView[str, JSONType]:
+        return self.data.items()
+
+    def values(self) -> ValuesView[JSONType]:
+        return self.data.values()
+
     def __len__(self) -> int:
         with self._run._store:
             return self._run.store.count_tags(self._run.id)
@@ -155,6 +175,9 @@ class Run(StoredModel):
     def __post_init__(self):
         super().__post_init__()
         self.tags = TagsMapping(self)
+        # metrics waiting to be written when buffering (see `buffered`)
+        self._pending: Optional[List[ValueMapping]] = None
+        self._flush_threshold: int = DEFAULT_FLUSH_THRESHOLD
 
     @store.wrap
     def log_param(
@@ -201,8 +224,38 @@ class Run(StoredModel):
         value: ValueType,
         *,
         step: Union[Value, int, None] = None,
-    ) -> Value:
+    ) -> Optional[Value]:
+        """
+        Log a metric of this run.
+
+        Parameters
+        ----------
+        key : str
+            The key of the metric.
+        value : ValueType
+            The value of the metric.
+        step : Value, int or None, optional
+            The step the metric belongs to, by default None.
+
+        Returns
+        -------
+        Optional[Value]
+            The logged value, or None while `buffered` is active since the
+            value is only written when the buffer is flushed. A buffered
+            metric therefore cannot be passed as `step`.
+        """
         step_id = step.id if isinstance(step, Value) else step
+        if self._pending is not None:
+            self._buffer([
+                {
+                    "key": key,
+                    "value": value,
+                    "type": "metric",
+                    "step_id": step_id,
+                    "is_step": False,
+                }
+            ])
+            return None
         return self.store.log_value(
             self.id,
             key,
@@ -220,6 +273,24 @@ class Run(StoredModel):
         step: Optional[Value] = None,
         prefix: Optional[str] = None,
     ) -> List[Value]:
+        """
+        Log the (flattened) metrics of this run.
+
+        Parameters
+        ----------
+        values : Mapping[str, ValueType]
+            The metrics to log, nested mappings are flattened.
+        step : Value, optional
+            The step the metrics belong to, by default None.
+        prefix : str, optional
+            The prefix of the flattened keys, by default None.
+
+        Returns
+        -------
+        List[Value]
+            The logged values, or an empty list while `buffered` is active
+            since the values are only written when the buffer is flushed.
+        """
         step_id = step.id if isinstance(step, Value) else step
         input_vals = []
         for key, value in flatten(values, parent_key=prefix).items():
@@ -230,12 +301,71 @@ class Run(StoredModel):
                 "step_id": step_id,
                 "is_step": False,
             })
+        if self._pending is not None:
+            self._buffer(input_vals)
+            return []
         return self.store.log_values(self.id, input_vals)
 
+    def _buffer(self, values: List[ValueMapping]) -> None:
+        self._pending.extend(values)
+        if len(self._pending) >= self._flush_threshold:
+            self.flush()
+
+    @store.wrap
+    def flush(self) -> List[Value]:
+        if not self._pending:
+            return []
+        pending, self._pending = self._pending, []
+        return self.store.log_values(self.id, pending)
+
+    @contextmanager
+    def buffered(
+        self, size: int = DEFAULT_FLUSH_THRESHOLD
+    ) -> Generator[Self, None, None]:
+        """
+        Buffer logged metrics and write them in batches.
+
+        The remaining metrics are flushed when the context exits, also when
+        the body raised, so the metrics logged before the error are kept.
+        Nested contexts share the buffer of the outermost one.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of buffered values that triggers a write, by default
+            DEFAULT_FLUSH_THRESHOLD.
+
+        Yields
+        ------
+        Run
+            This run. `log_metric` and `log_metrics` return None and an
+            empty list while buffering.
+        """
+        if self._pending is not None:
+            # already buffering - the outermost context flushes
+            yield self
+            return
+        self._pending, self._flush_threshold = [], size
+        try:
+            yield self
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._pending = None
+
     @store.wrap
     def get_values(self) -> List[Tuple[Variable, Value]]:
         return self.store.get_values(self.id)
 
+    def iter_values(self) -> Iterator[Tuple[Variable, Value]]:
+        # the store binds the context while the values are read
+        return self._store.iter_values(self.id)
+
+    @store.wrap
+    def get_values_df(self) -> pd.DataFrame:
+        return self.store.get_values_df(self.id)
+
 
 class Variable(StoredModel):
     id: int = field(init=False)
@@ -309,19 +439,17 @@ class TreeNode(UserDict):
         return tree
 
     @classmethod
-    def from_values(cls, values: List[Tuple[Variable, Value]]) -> Self:
+    def from_values(cls, values: Iterable[Tuple[Variable, Value]]) -> Self:
         nodes = {}
-        is_step = {}
+        tree = {"__root__": {}}
+        # single pass so that values can be streamed (e.g., from a query)
         for var, value in values:
-            is_step[value.id] = var.is_step
-            nodes[value.id] = (var.key, value.value)
-        tree = {}
-        for _, value in values:
             sn, vn = value.step_id, value.id
+            nodes[vn] = (var.key, value.value)
             if sn is None:
                 sn = "__root__"
             if vn not in tree:
-                tree[vn] = {} if is_step[value.id] else None
+                tree[vn] = {} if var.is_step else None
             if sn not in tree:
                 tree[sn] = {}
             tree[sn][vn] = tree[vn]
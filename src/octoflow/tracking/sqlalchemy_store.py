@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 import datetime as dt
-from collections import deque
 from contextlib import contextmanager
-from typing import ClassVar, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import ParseResult, urlparse
 
 import sqlalchemy
@@ -24,6 +34,8 @@ from sqlalchemy import (
     create_engine,
     desc,
 )
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, registry
 from sqlalchemy.orm.exc import MultipleResultsFound, NoResultFound
 
@@ -36,7 +48,17 @@ from octoflow.tracking.models import (
     Value,
     Variable,
 )
-from octoflow.tracking.store import TrackingStore, ValueType, VariableType
+from octoflow.tracking.store import (
+    VALUES_DF_COLUMNS,
+    TrackingStore,
+    ValueMapping,
+    ValueTuple,
+    ValueType,
+    VariableType,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 __all__ = [
     "SQLAlchemyTrackingStore",
@@ -45,6 +67,8 @@ __all__ = [
 
 mapper_registry = registry()
 
+T = TypeVar("T")
+
 
 class SQLAlchemyModelMixin:
     @sqlalchemy.orm.reconstructor
@@ -114,6 +138,34 @@ class Value(Value, SQLAlchemyModelMixin, registry=mapper_registry):
     )
 
 
+value_indexes = (
+    # values are read by run and steps are resolved by step_id
+    Index("ix_value_run_id", Value.run_id),
+    Index("ix_value_step_id", Value.step_id),
+)
+
+# dialects that support INSERT ... ON CONFLICT DO NOTHING
+_INSERT_IGNORE = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# value inserts bypass the ORM, the statements are built once and reused
+_VALUE_INSERT = sqlalchemy.insert(Value.__table__)
+_VALUE_INSERT_RETURNING = _VALUE_INSERT.returning(
+    Value.__table__.c.id,
+    Value.__table__.c.timestamp,
+    sort_by_parameter_order=True,
+)
+# ordered RETURNING falls back to one INSERT per row on SQLite, which assigns
+#   increasing ids to the rows of a statement in order - sorting on the id
+#   restores the parameter order
+_VALUE_INSERT_RETURNING_UNORDERED = _VALUE_INSERT.returning(
+    Value.__table__.c.id,
+    Value.__table__.c.timestamp,
+)
+
+
 class Variable(Variable, SQLAlchemyModelMixin, registry=mapper_registry):
     __table__: ClassVar[Table] = Table(
         "variable",
@@ -150,6 +202,40 @@ variable_constraints = (
     ),
 )
 
+# the value queries of a run are built once, the run is a bound parameter
+_SELECT_VALUES = (
+    sqlalchemy
+    .select(Variable, Value)
+    .select_from(Value)
+    .join(Variable, Value.variable_id == Variable.id)
+    .where(Value.run_id == sqlalchemy.bindparam("run_id"))
+    .order_by(Value.id)
+)
+
+_SELECT_VALUES_AFTER = _SELECT_VALUES.where(
+    Value.id > sqlalchemy.bindparam("after_id")
+).limit(sqlalchemy.bindparam("limit"))
+
+# plain result rows (no ORM objects) that are passed to pandas directly
+_SELECT_VALUE_ROWS = (
+    sqlalchemy
+    .select(
+        Value.__table__.c.id,
+        Value.__table__.c.step_id,
+        Variable.__table__.c.key,
+        Value.__table__.c.value,
+        Variable.__table__.c.type,
+        Variable.__table__.c.is_step,
+    )
+    .select_from(Value.__table__)
+    .join(
+        Variable.__table__,
+        Value.__table__.c.variable_id == Variable.__table__.c.id,
+    )
+    .where(Value.__table__.c.run_id == sqlalchemy.bindparam("run_id"))
+    .order_by(Value.__table__.c.id)
+)
+
 
 class Tag(Tag, SQLAlchemyModelMixin, registry=mapper_registry):
     __table__: ClassVar[Table] = Table(
@@ -182,12 +268,47 @@ class RunTags(RunTags, SQLAlchemyModelMixin, registry=mapper_registry):
     )
 
 
-class SQLAlchemyTrackingStore(TrackingStore):
+def _batched(items: Iterable[T], size: int) -> Generator[List[T], None, None]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _check_variable(
+    variable: Variable,
+    type: Optional[VariableType] = None,
+    is_step: Optional[bool] = None,
+) -> None:
+    # a stored variable keeps its type and is_step, None matches any
+    if type is not None and variable.type != type:
+        msg = (
+            f"expected type '{variable.type}', got '{type}' for variable "
+            f"with key '{variable.key}'"
+        )
+        raise ValueError(msg)
+    if is_step is not None and variable.is_step is not is_step:
+        msg = (
+            f"expected is_step '{variable.is_step}', got '{is_step}' for "
+            f"variable with key '{variable.key}'"
+        )
+        raise ValueError(msg)
+
+
+class SQLAlchemyTrackingStore(TrackingStore):  # noqa: PLR0904
     """SQLAlchemy tracking store.
 
     This class is used to define the interface for tracking store.
     """
 
+    # rows (or IN parameters) per statement - keeps large batches within
+    #   driver parameter limits (e.g., SQLITE_MAX_VARIABLE_NUMBER)
+    batch_size: ClassVar[int] = 500
+
     def __init__(
         self,
         url: Union[str, URL] = "sqlite:///:memory:",
@@ -209,6 +330,13 @@ class SQLAlchemyTrackingStore(TrackingStore):
             lockfile = FileLock(lockfile)
         self.lock: Optional[FileLock] = lockfile
         self.engine = create_engine(url)
+        # variables are never deleted (other than with their experiment)
+        #   so they are cached by (experiment_id, key, parent_id)
+        self._variable_cache: Dict[
+            Tuple[int, str, Optional[int]], Variable
+        ] = {}
+        # experiment id of each run values were logged to
+        self._experiment_ids: Dict[int, int] = {}
         self.create_all()
 
     def create_all(self, checkfirst: bool = True):
@@ -216,6 +344,10 @@ class SQLAlchemyTrackingStore(TrackingStore):
             self.engine,
             checkfirst=checkfirst,
         )
+        # create_all skips tables that exist, add indexes introduced after
+        #   a database was created (new tables already have them)
+        for index in value_indexes:
+            index.create(self.engine, checkfirst=True)
 
     @contextmanager
     def session(self):
@@ -226,18 +358,55 @@ class SQLAlchemyTrackingStore(TrackingStore):
                 # another process might be using the lock
                 raise e
         try:
-            with Session(self.engine) as session:
+            # objects keep their state on commit so that only objects that
+            #   were expired (e.g., by a rollback) need to be refreshed
+            with Session(self.engine, expire_on_commit=False) as session:
                 try:
                     yield session
                 except Exception as e:
                     raise e
                 finally:
-                    deque(map(session.refresh, iter(session)))
+                    for obj in session:
+                        if sqlalchemy.inspect(obj).expired_attributes:
+                            session.refresh(obj)
                     session.expunge_all()
         finally:
             if self.lock is not None:
                 self.lock.release()
 
+    def _get_cached_variable(
+        self,
+        experiment_id: int,
+        key: str,
+        parent_id: Optional[int],
+        type: Optional[VariableType] = None,
+        is_step: Optional[bool] = None,
+    ) -> Optional[Variable]:
+        cache_key = (experiment_id, key, parent_id)
+        variable = self._variable_cache.get(cache_key)
+        if variable is None:
+            return None
+        if (type is not None and variable.type != type) or (
+            is_step is not None and variable.is_step is not is_step
+        ):
+            # the cached variable may be outdated (e.g., is_step changed)
+            #   let the database decide
+            self._variable_cache.pop(cache_key, None)
+            return None
+        return variable
+
+    def _get_experiment_id(self, session: Session, run_id: int) -> int:
+        experiment_id = self._experiment_ids.get(run_id)
+        if experiment_id is None:
+            run: Run = session.get(Run, run_id)
+            experiment_id = run.experiment_id
+            self._experiment_ids[run_id] = experiment_id
+        return experiment_id
+
+    def _cache_variable(self, variable: Variable) -> None:
+        cache_key = (variable.experiment_id, variable.key, variable.parent_id)
+        self._variable_cache[cache_key] = variable
+
     def create_experiment(
         self,
         name: str,
@@ -266,7 +435,7 @@ class SQLAlchemyTrackingStore(TrackingStore):
 
     def get_experiment(self, experiment_id: int) -> Experiment:
         with self.session() as session:
-            expr = session.query(Experiment).get(experiment_id)
+            expr = session.get(Experiment, experiment_id)
         if expr is None:
             msg = f"experiment with id '{experiment_id}' does not exist"
             raise ValueError(msg)
@@ -321,6 +490,7 @@ class SQLAlchemyTrackingStore(TrackingStore):
                 session.rollback()
                 msg = f"could not delete run with id '{run_id}'"
                 raise ValueError(msg) from e
+        self._experiment_ids.pop(run_id, None)
 
     def search_runs(
         self,
@@ -344,39 +514,45 @@ class SQLAlchemyTrackingStore(TrackingStore):
     ) -> RunTags:
         msg = f"could not set tag '{name}' for run with id '{run_id}'"
         with self.session() as session:
-            tag = Tag(name=name)
-            try:
-                session.add(tag)
-                session.commit()
-            except Exception:
-                session.rollback()
-                tag = session.query(Tag).filter(Tag.name == name).one_or_none()
+            # look up before inserting so that updating the value of an
+            #   existing tag does not go through failed inserts
+            tag = session.query(Tag).filter(Tag.name == name).one_or_none()
+            if tag is None:
+                tag = Tag(name=name)
+                try:
+                    session.add(tag)
+                    session.flush()
+                except Exception:
+                    # the tag may have been created concurrently
+                    session.rollback()
+                    tag = (
+                        session
+                        .query(Tag)
+                        .filter(Tag.name == name)
+                        .one_or_none()
+                    )
             if tag is None:
                 # unale to get or create tag
                 raise ValueError(msg)
-            run_tag = RunTags(
-                run_id=run_id,
-                tag_id=tag.id,
-                value=value,
-            )
-            try:
-                session.add(run_tag)
-                session.commit()
-                return run_tag
-            except Exception:
-                session.rollback()
             run_tag = (
-                session.query(RunTags)
+                session
+                .query(RunTags)
                 .filter(
                     RunTags.run_id == run_id,
                     RunTags.tag_id == tag.id,
                 )
-                .first()
+                .one_or_none()
             )
             if run_tag is None:
-                raise ValueError(msg)
-            # try to update the value
-            run_tag.value = value
+                run_tag = RunTags(
+                    run_id=run_id,
+                    tag_id=tag.id,
+                    value=value,
+                )
+                session.add(run_tag)
+            else:
+                # try to update the value
+                run_tag.value = value
             try:
                 session.commit()
             except Exception as e:
@@ -387,7 +563,8 @@ class SQLAlchemyTrackingStore(TrackingStore):
     def get_tag(self, run_id: int, name: str) -> JSONType:
         with self.session() as session:
             stmt = (
-                session.query(RunTags)
+                session
+                .query(RunTags)
                 .select_from(RunTags)
                 .join(Tag, RunTags.tag_id == Tag.id)
                 .filter(
@@ -403,7 +580,8 @@ class SQLAlchemyTrackingStore(TrackingStore):
     def get_tags(self, run_id: int) -> Dict[str, JSONType]:
         with self.session() as session:
             stmt = (
-                session.query(Tag, RunTags)
+                session
+                .query(Tag, RunTags)
                 .select_from(RunTags)
                 .join(Tag, RunTags.tag_id == Tag.id)
                 .filter(RunTags.run_id == run_id)
@@ -417,7 +595,8 @@ class SQLAlchemyTrackingStore(TrackingStore):
     def count_tags(self, run_id: int) -> int:
         with self.session() as session:
             stmt = (
-                session.query(Tag, RunTags)
+                session
+                .query(Tag, RunTags)
                 .select_from(RunTags)
                 .join(Tag, RunTags.tag_id == Tag.id)
                 .filter(RunTags.run_id == run_id)
@@ -432,7 +611,8 @@ class SQLAlchemyTrackingStore(TrackingStore):
             if tag is None:
                 return None
             run_tag = (
-                session.query(RunTags)
+                session
+                .query(RunTags)
                 .filter(
                     RunTags.run_id == run_id,
                     RunTags.tag_id == tag.id,
@@ -449,6 +629,52 @@ class SQLAlchemyTrackingStore(TrackingStore):
                 raise ValueError(msg) from e
         return run_tag
 
+    def _get_or_create_variable(
+        self,
+        experiment_id: int,
+        key: str,
+        parent_id: Optional[int],
+        type: Optional[VariableType] = None,
+        is_step: Optional[bool] = None,
+    ) -> Variable:
+        variable = Variable(
+            experiment_id=experiment_id,
+            key=key,
+            type=type,
+            parent_id=parent_id,
+            is_step=is_step,
+        )
+        if self.engine.dialect.name in _INSERT_IGNORE:
+            # no failing INSERT (and rollback) when the variable exists
+            with self.session() as session:
+                (variable,) = self._insert_variables(session, [variable])
+                session.commit()
+            return variable
+        try:
+            with self.session() as session:
+                session.add(variable)
+                session.commit()
+        except Exception as ex:
+            try:
+                with self.session() as session:
+                    variable = (
+                        session
+                        .query(Variable)
+                        .filter(
+                            Variable.experiment_id == experiment_id,
+                            Variable.key == key,
+                            Variable.parent_id == parent_id,
+                        )
+                        .one()
+                    )
+            except Exception as e:
+                raise e from ex
+            try:
+                _check_variable(variable, type, is_step)
+            except ValueError as e:
+                raise e from ex
+        return variable
+
     def log_value(
         self,
         run_id: int,
@@ -461,12 +687,12 @@ class SQLAlchemyTrackingStore(TrackingStore):
         is_step: Optional[bool] = None,
     ) -> Value:
         with self.session() as session:
-            run: Run = session.query(Run).get(run_id)
+            experiment_id = self._get_experiment_id(session, run_id)
         parent_id = None
         if step_id is not None:
             with self.session() as session:
                 # return an instance or None if not found
-                step: Value = session.query(Value).get(step_id)
+                step: Value = session.get(Value, step_id)
             if step is None:
                 msg = f"step with key '{key}' does not exist"
                 raise ValueError(msg)
@@ -475,7 +701,7 @@ class SQLAlchemyTrackingStore(TrackingStore):
                 raise ValueError(msg)
             parent_id = step.variable_id
             with self.session() as session:
-                parent: Variable = session.query(Variable).get(parent_id)
+                parent: Variable = session.get(Variable, parent_id)
                 if parent.is_step is None:
                     parent.is_step = (
                         True  # update variable to be a step variable
@@ -485,70 +711,283 @@ class SQLAlchemyTrackingStore(TrackingStore):
                     except Exception as e:
                         session.rollback()
                         raise e
+                    self._cache_variable(parent)
                 elif not parent.is_step:
                     msg = f"variable with key '{parent.key}' is not marked as a step variable"
                     raise ValueError(msg)
-        variable = Variable(
-            experiment_id=run.experiment_id,
-            key=key,
-            type=type,
-            parent_id=parent_id,
-            is_step=is_step,
+        variable = self._get_cached_variable(
+            experiment_id, key, parent_id, type=type, is_step=is_step
         )
-        try:
-            with self.session() as session:
-                session.add(variable)
-                session.commit()
-        except Exception as ex:
-            try:
-                with self.session() as session:
-                    variable = (
-                        session.query(Variable)
-                        .filter(
-                            Variable.experiment_id == run.experiment_id,
-                            Variable.key == key,
-                            Variable.parent_id == parent_id,
-                        )
-                        .one()
-                    )
-            except Exception as e:
-                raise e from ex
-            if type is not None and variable.type != type:
-                msg = f"expected type '{variable.type}', got '{type}' for variable with key '{variable.key}'"
-                raise ValueError(msg) from ex
-            if is_step is not None and variable.is_step is not is_step:
-                msg = f"expected is_step '{variable.is_step}', got '{is_step}' for variable with key '{variable.key}'"
-                raise ValueError(msg) from ex
+        if variable is None:
+            variable = self._get_or_create_variable(
+                experiment_id, key, parent_id, type=type, is_step=is_step
+            )
+            self._cache_variable(variable)
+        params = {
+            "run_id": run_id,
+            "variable_id": variable.id,
+            "value": value,
+            "step_id": step_id,
+        }
+        if value_id is not None:
+            params["id"] = value_id
+        # a single row without relationships does not need the unit of work
+        #   of the ORM - insert it with a Core statement
+        with self.session() as session:
+            result = session.execute(_VALUE_INSERT, params)
+            session.commit()
+        params = result.last_inserted_params()
         value = Value(
             run_id=run_id,
             variable_id=variable.id,
             value=value,
+            timestamp=params["timestamp"],
             step_id=step_id,
         )
-        if value_id is not None:
-            value.id = value_id
+        value.id = result.inserted_primary_key[0]
+        return value
+
+    def log_values(
+        self,
+        run_id: int,
+        values: List[Union[ValueMapping, ValueTuple, Value]],
+        *,
+        step_id: Optional[int] = None,
+        type: Optional[VariableType] = None,
+    ) -> List[Value]:
+        values = [self._to_value_tuple(value) for value in values]
+        if len(values) == 0:
+            return []
         try:
             with self.session() as session:
-                session.add(value)
+                rows, variables = self._prepare_value_rows(
+                    session, run_id, values, step_id=step_id, type=type
+                )
+                inserted = self._insert_values(session, rows)
                 session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
-        return value
+        except IntegrityError:
+            # e.g., a variable was created concurrently - log one by one
+            return super().log_values(
+                run_id, values, step_id=step_id, type=type
+            )
+        for variable in variables:
+            self._cache_variable(variable)
+        logged = []
+        for row, (value_id, timestamp) in zip(rows, inserted):
+            value = Value(timestamp=timestamp, **row)
+            value.id = value_id
+            logged.append(value)
+        return logged
+
+    def _insert_values(
+        self, session: Session, rows: List[dict]
+    ) -> List[Tuple[int, dt.datetime]]:
+        # multi-row INSERTs of up to batch_size values, committed by the
+        #   caller as a single transaction
+        inserted = []
+        for batch in _batched(rows, self.batch_size):
+            if self.engine.dialect.name == "sqlite":
+                result = session.execute(
+                    _VALUE_INSERT_RETURNING_UNORDERED, batch
+                )
+                inserted.extend(sorted(result.all()))
+            else:
+                result = session.execute(_VALUE_INSERT_RETURNING, batch)
+                inserted.extend(result.all())
+        return inserted
 
-    def get_values(self, run_id: int) -> List[Tuple[Variable, Value]]:
-        with self.session() as session:
-            stmt = (
-                session.query(Variable, Value)
-                .select_from(Value)
-                .join(
-                    Variable,
-                    Value.variable_id == Variable.id,
+    def _prepare_value_rows(
+        self,
+        session: Session,
+        run_id: int,
+        values: List[ValueTuple],
+        *,
+        step_id: Optional[int] = None,
+        type: Optional[VariableType] = None,
+    ) -> Tuple[List[dict], List[Variable]]:
+        experiment_id = self._get_experiment_id(session, run_id)
+        # variable id of the step values used by the batch
+        parent_ids: Dict[int, int] = {}
+        # variables to cache once the batch is committed
+        used: List[Variable] = []
+        for value in values:
+            value_step_id = step_id or value.step_id
+            if value_step_id is None or value_step_id in parent_ids:
+                continue
+            step: Value = session.get(Value, value_step_id)
+            if step is None:
+                msg = f"step with key '{value.key}' does not exist"
+                raise ValueError(msg)
+            if step.run_id != run_id:
+                msg = (
+                    f"step with key '{value.key}' does not belong to run "
+                    f"with id '{run_id}'"
+                )
+                raise ValueError(msg)
+            parent: Variable = session.get(Variable, step.variable_id)
+            if parent.is_step is None:
+                # update variable to be a step variable
+                parent.is_step = True
+                used.append(parent)
+            elif not parent.is_step:
+                msg = (
+                    f"variable with key '{parent.key}' is not marked as a "
+                    "step variable"
+                )
+                raise ValueError(msg)
+            parent_ids[value_step_id] = parent.id
+        variables: Dict[Tuple[str, Optional[int]], Variable] = {}
+        for value in values:
+            parent_id = parent_ids.get(step_id or value.step_id)
+            variable = self._get_cached_variable(
+                experiment_id,
+                value.key,
+                parent_id,
+                type=type or value.type,
+                is_step=value.is_step,
+            )
+            if variable is not None:
+                variables[value.key, parent_id] = variable
+        missing = {
+            value.key
+            for value in values
+            if (value.key, parent_ids.get(step_id or value.step_id))
+            not in variables
+        }
+        if missing:
+            # fetch the other variables of the batch
+            variables.update(
+                ((variable.key, variable.parent_id), variable)
+                for variable in self._query_variables(
+                    session, experiment_id, missing
+                )
+            )
+        # (variable key, value, step id) of each value of the batch
+        resolved = []
+        created: List[Variable] = []
+        for value in values:
+            value_step_id = step_id or value.step_id
+            value_type = type or value.type
+            parent_id = parent_ids.get(value_step_id)
+            variable = variables.get((value.key, parent_id))
+            if variable is None:
+                variable = Variable(
+                    experiment_id=experiment_id,
+                    key=value.key,
+                    type=value_type,
+                    parent_id=parent_id,
+                    is_step=value.is_step,
                 )
-                .filter(Value.run_id == run_id)
+                created.append(variable)
+                variables[value.key, parent_id] = variable
+            else:
+                _check_variable(variable, value_type, value.is_step)
+            resolved.append((
+                (value.key, parent_id),
+                value.value,
+                value_step_id,
+            ))
+        if created:
+            for variable in self._insert_variables(session, created):
+                variables[variable.key, variable.parent_id] = variable
+        rows = [
+            {
+                "run_id": run_id,
+                "variable_id": variables[variable_key].id,
+                "value": value,
+                "step_id": value_step_id,
+            }
+            for variable_key, value, value_step_id in resolved
+        ]
+        used.extend(variables.values())
+        return rows, used
+
+    def _query_variables(
+        self, session: Session, experiment_id: int, keys: Iterable[str]
+    ) -> Generator[Variable, None, None]:
+        # one query per batch_size keys (each key is a bound parameter)
+        for batch in _batched(keys, self.batch_size):
+            yield from session.query(Variable).filter(
+                Variable.experiment_id == experiment_id,
+                Variable.key.in_(batch),
             )
-            values = stmt.order_by(Value.id).all()
+
+    def _insert_variables(
+        self, session: Session, variables: List[Variable]
+    ) -> List[Variable]:
+        insert = _INSERT_IGNORE.get(session.get_bind().dialect.name)
+        if insert is None:
+            # a single flush for all new variables of the batch
+            session.add_all(variables)
+            session.flush()
+            return variables
+        # insert the variables, skipping ones that were created concurrently,
+        #   and read all of them back with a single query
+        statement = insert(Variable.__table__).on_conflict_do_nothing()
+        for batch in _batched(variables, self.batch_size):
+            session.execute(
+                statement,
+                [
+                    {
+                        "experiment_id": variable.experiment_id,
+                        "key": variable.key,
+                        "type": variable.type,
+                        "parent_id": variable.parent_id,
+                        "is_step": variable.is_step,
+                    }
+                    for variable in batch
+                ],
+            )
+        stored: Dict[Tuple[str, Optional[int]], Variable] = {
+            (variable.key, variable.parent_id): variable
+            for variable in self._query_variables(
+                session,
+                variables[0].experiment_id,
+                {variable.key for variable in variables},
+            )
+        }
+        inserted = []
+        for variable in variables:
+            other = stored[variable.key, variable.parent_id]
+            _check_variable(other, variable.type, variable.is_step)
+            inserted.append(other)
+        return inserted
+
+    def get_values(self, run_id: int) -> List[Tuple[Variable, Value]]:
+        with self.session() as session:
+            values = session.execute(_SELECT_VALUES, {"run_id": run_id}).all()
         return values
 
+    def iter_values(
+        self, run_id: int
+    ) -> Generator[Tuple[Variable, Value], None, None]:
+        # values are read batch_size at a time (keyset pagination on the
+        #   value id), the store context, the session and the lock are only
+        #   held while a batch is read and never across a yield
+        after_id = 0
+        while True:
+            with self, self.session() as session:
+                batch = session.execute(
+                    _SELECT_VALUES_AFTER,
+                    {
+                        "run_id": run_id,
+                        "after_id": after_id,
+                        "limit": self.batch_size,
+                    },
+                ).all()
+            yield from batch
+            if len(batch) < self.batch_size:
+                break
+            after_id = batch[-1][1].id
+
+    def get_values_df(self, run_id: int) -> pd.DataFrame:
+        import pandas as pd  # noqa: PLC0415
+
+        with self.session() as session:
+            rows = session.execute(
+                _SELECT_VALUE_ROWS, {"run_id": run_id}
+            ).all()
+        return pd.DataFrame.from_records(rows, columns=VALUES_DF_COLUMNS)
+
 
 class SQLAlchemyStore(SQLAlchemyTrackingStore): ...
@@ -9,6 +9,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Generator,
     List,
     Literal,
     Mapping,
@@ -22,6 +23,8 @@ from typing import (
 from octoflow.data.dataclass import BaseModel
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from octoflow.tracking.models import (
         Experiment,
         JSONType,
@@ -68,6 +71,9 @@ def wrap(method):
             store = self._store
         elif isinstance(self, TrackingStore):
             store = self
+        if store_cv.get() is store:
+            # nested call - the store is already set in this context
+            return method(self, *args, **kwargs)
         with store:
             return method(self, *args, **kwargs)
 
@@ -83,6 +89,9 @@ class ValueMapping(TypedDict):
     is_step: Optional[bool]
 
 
+VALUES_DF_COLUMNS = ["id", "step_id", "key", "value", "type", "is_step"]
+
+
 class ValueTuple(NamedTuple):
     key: str
     value: ValueType
@@ -104,7 +113,7 @@ class TrackingStoreMetaClass(abc.ABCMeta):
         return super().__new__(cls, name, bases, attrs, **kwargs)
 
 
-class TrackingStore(metaclass=TrackingStoreMetaClass):
+class TrackingStore(metaclass=TrackingStoreMetaClass):  # noqa: PLR0904
     """Abstract class for tracking store.
 
     This class is used to define the interface for tracking store.
@@ -198,6 +207,17 @@ class TrackingStore(metaclass=TrackingStoreMetaClass):
     ) -> Value:
         raise NotImplementedError
 
+    @staticmethod
+    def _to_value_tuple(value: Union[ValueMapping, ValueTuple]) -> ValueTuple:
+        if isinstance(value, Mapping):
+            return ValueTuple(**value)
+        if isinstance(value, ValueTuple):
+            return value
+        if isinstance(value, Tuple):
+            return ValueTuple(*value)
+        msg = f"expected 'dict' or 'tuple', got '{value.__class__.__name__}'"
+        raise TypeError(msg)
+
     def _log_value(
         self,
         run_id: int,
@@ -206,17 +226,7 @@ class TrackingStore(metaclass=TrackingStoreMetaClass):
         step_id: Optional[int] = None,
         type: Optional[VariableType] = None,
     ) -> Value:
-        if isinstance(value, Mapping):
-            value = ValueTuple(**value)
-        elif isinstance(value, ValueTuple):
-            pass
-        elif isinstance(value, Tuple):
-            value = ValueTuple(*value)
-        else:
-            msg = (
-                f"expected 'dict' or 'tuple', got '{value.__class__.__name__}'"
-            )
-            raise TypeError(msg)
+        value = self._to_value_tuple(value)
         return self.log_value(
             run_id,
             value.key,
@@ -234,8 +244,9 @@ class TrackingStore(metaclass=TrackingStoreMetaClass):
         step_id: Optional[int] = None,
         type: Optional[VariableType] = None,
     ) -> List[Value]:
+        log_value = self._log_value
         return [
-            self._log_value(run_id, value, step_id=step_id, type=type)
+            log_value(run_id, value, step_id=step_id, type=type)
             for value in values
         ]
 
@@ -243,6 +254,29 @@ class TrackingStore(metaclass=TrackingStoreMetaClass):
     def get_values(self, run_id: int) -> List[Tuple[Variable, Value]]:
         raise NotImplementedError
 
+    def iter_values(
+        self, run_id: int
+    ) -> Generator[Tuple[Variable, Value], None, None]:
+        yield from self.get_values(run_id)
+
+    def get_values_df(self, run_id: int) -> pd.DataFrame:
+        import pandas as pd  # noqa: PLC0415
+
+        return pd.DataFrame.from_records(
+            (
+                (
+                    value.id,
+                    value.step_id,
+                    variable.key,
+                    value.value,
+                    variable.type,
+                    variable.is_step,
+                )
+                for variable, value in self.get_values(run_id)
+            ),
+            columns=VALUES_DF_COLUMNS,
+        )
+
     def import_store(self, other: TrackingStore):
         for other_experiment in other.list_experiments():
             try:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections.abc
 import functools
 import weakref
 from collections import defaultdict
@@ -8,7 +9,6 @@ from typing import (
     Dict,
     Generator,
     Iterable,
-    Mapping,
     MutableMapping,
     MutableSequence,
     Optional,
@@ -21,6 +21,7 @@ from typing import MutableSet as MutableSetType
 
 __all__ = [
     "flatten",
+    "iter_flatten",
 ]
 
 
@@ -171,6 +172,58 @@ class MutableSet(MutableCollection, MutableSetType[V]):
         return repr(self._data)
 
 
+def iter_flatten(
+    data: Dict[str, Any],
+    *,
+    separator: str = ".",
+    parent_key: Optional[str] = None,
+) -> Generator[Tuple[Union[str, Tuple[str]], Any], None, None]:
+    """
+    Iterate over the flattened items of a nested dictionary.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        The nested dictionary to flatten.
+    separator : str, optional
+        The separator, by default "."
+    parent_key : Optional[str], optional
+        The parent key, by default None
+
+    Yields
+    ------
+    tuple[str | tuple[str], Any]
+        The flattened key and the value, in depth-first order. A key may be
+        yielded more than once (e.g., for {"a.b": 1, "a": {"b": 2}}).
+    """
+    if separator is not None:
+        # keys are built from a precomputed prefix (parent key + separator)
+        #   so that each key is a single concatenation
+        parent_key = parent_key + separator if parent_key else ""
+    # iterative depth-first traversal - a stack of (key, items iterator)
+    #   keeps the order of a recursive traversal without intermediate dicts
+    stack = [(parent_key, iter(data.items()))]
+    # local names avoid global/attribute lookups in the loop, the abc
+    #   is checked directly instead of through the typing alias
+    push, pop, is_instance = stack.append, stack.pop, isinstance
+    mapping_type = collections.abc.Mapping
+    while stack:
+        parent_key, items = stack[-1]
+        for key, value in items:
+            if separator is None:
+                new_key = (parent_key, key) if parent_key is not None else key
+            else:
+                new_key = parent_key + key
+            if is_instance(value, mapping_type):
+                if separator is not None:
+                    new_key = new_key + separator if new_key else ""
+                push((new_key, iter(value.items())))
+                break
+            yield new_key, value
+        else:
+            pop()
+
+
 def flatten(
     data: Dict[str, Any],
     *,
@@ -194,19 +247,14 @@ def flatten(
     Dict[str | tuple[str], Any]
         The flattened dictionary.
     """
-    if separator is not None and parent_key is None:
-        parent_key = ""
-    items = []
-    for key, value in data.items():
-        # escape dots
-        if separator is None:
-            new_key = (parent_key, key) if parent_key is not None else key
-        else:
-            new_key = parent_key + separator + key if parent_key else key
-        if isinstance(value, Mapping):
-            items.extend(
-                flatten(value, parent_key=new_key, separator=separator).items()
-            )
-        else:
-            items.append((new_key, value))
-    return dict(items)
+    if separator is None:
+        has_prefix = parent_key is not None
+    else:
+        has_prefix = bool(parent_key)
+    mapping_type = collections.abc.Mapping
+    if not has_prefix and not any(
+        isinstance(value, mapping_type) for value in data.values()
+    ):
+        # already flat (e.g., a dict of metrics) - keys are unchanged
+        return dict(data)
+    return dict(iter_flatten(data, separator=separator, parent_key=parent_key))
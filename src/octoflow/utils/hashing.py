@@ -278,10 +278,13 @@ def hash(*obj, coerce_mmap=False):
         hasher = NumpyHasher(coerce_mmap=coerce_mmap)
     else:
         hasher = Hasher()
-    objr = ", ".join([
-        o.__class__.__name__ if hasattr(o, "__class__") else "?" for o in obj
-    ])
-    logger.debug("Generating hash of objects of type(s): %s", objr)
+    if logger.isEnabledFor(logging.DEBUG):
+        # only build the list of type names when it is going to be logged
+        objr = ", ".join([
+            o.__class__.__name__ if hasattr(o, "__class__") else "?"
+            for o in obj
+        ])
+        logger.debug("Generating hash of objects of type(s): %s", objr)
     obj = _MyHash("==HashGroup==", *obj)
     return hasher.hash(obj)
 
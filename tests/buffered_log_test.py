@@ -0,0 +1,66 @@
+import unittest
+
+from octoflow.tracking import SQLAlchemyTrackingStore, TrackingClient
+
+
+class TestBufferedLogging(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLAlchemyTrackingStore()
+        client = TrackingClient(self.store)
+        with self.store:
+            experiment = client.create_experiment("Test Experiment")
+            self.run_ = experiment.start_run("Test Run")
+
+    def count_values(self) -> int:
+        return len(self.run_.get_values())
+
+    def test_flush_when_size_is_reached(self):
+        with self.run_.buffered(size=3) as run:
+            self.assertIsNone(run.log_metric("loss", 0.1))
+            self.assertEqual(run.log_metrics({"acc": 0.5}), [])
+            self.assertEqual(self.count_values(), 0)
+            run.log_metric("loss", 0.2)
+            # the third value fills the buffer
+            self.assertEqual(self.count_values(), 3)
+            run.log_metric("loss", 0.3)
+            self.assertEqual(self.count_values(), 3)
+        self.assertEqual(self.count_values(), 4)
+
+    def test_flush_on_exception(self):
+        with self.assertRaises(RuntimeError), self.run_.buffered() as run:
+            run.log_metric("loss", 0.1)
+            run.log_metric("loss", 0.2)
+            msg = "training failed"
+            raise RuntimeError(msg)
+        values = [value.value for _, value in self.run_.get_values()]
+        self.assertEqual(values, [0.1, 0.2])
+
+    def test_nested_contexts_flush_at_outermost_exit(self):
+        with self.run_.buffered() as run:
+            run.log_metric("loss", 0.1)
+            with run.buffered(size=1):
+                # the inner context neither resizes nor flushes the buffer
+                run.log_metric("loss", 0.2)
+            self.assertEqual(self.count_values(), 0)
+        self.assertEqual(self.count_values(), 2)
+
+    def test_params_are_not_buffered(self):
+        with self.run_.buffered() as run:
+            epoch = run.log_param("epoch", 1)
+            self.assertIsNotNone(epoch.id)
+            self.assertEqual(self.count_values(), 1)
+            run.log_metric("loss", 0.1, step=epoch)
+            self.assertEqual(self.count_values(), 1)
+        steps = [value.step_id for _, value in self.run_.get_values()]
+        self.assertEqual(steps, [None, epoch.id])
+
+    def test_log_metric_returns_value_after_buffering(self):
+        with self.run_.buffered():
+            pass
+        value = self.run_.log_metric("loss", 0.1)
+        self.assertEqual(value.value, 0.1)
+        self.assertIsNotNone(value.id)
+
+
+if __name__ == "__main__":
+    unittest.main()
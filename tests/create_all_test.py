@@ -0,0 +1,35 @@
+import unittest
+
+import sqlalchemy
+
+from octoflow.tracking import SQLAlchemyTrackingStore
+from octoflow.tracking.sqlalchemy_store import mapper_registry, value_indexes
+
+
+class TestCreateAll(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLAlchemyTrackingStore()
+
+    def get_value_indexes(self):
+        inspector = sqlalchemy.inspect(self.store.engine)
+        return {index["name"] for index in inspector.get_indexes("value")}
+
+    def test_create_all_without_checkfirst(self):
+        mapper_registry.metadata.drop_all(self.store.engine)
+        self.store.create_all(checkfirst=False)
+        self.assertEqual(
+            self.get_value_indexes(), {"ix_value_run_id", "ix_value_step_id"}
+        )
+
+    def test_create_all_adds_missing_indexes(self):
+        for index in value_indexes:
+            index.drop(self.store.engine)
+        self.assertEqual(self.get_value_indexes(), set())
+        self.store.create_all()
+        self.assertEqual(
+            self.get_value_indexes(), {"ix_value_run_id", "ix_value_step_id"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
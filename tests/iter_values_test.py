@@ -0,0 +1,59 @@
+import unittest
+
+from octoflow.tracking import SQLAlchemyTrackingStore, TrackingClient
+from octoflow.tracking.models import TreeNode
+from octoflow.tracking.store import store_cv
+
+
+class TestIterValues(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLAlchemyTrackingStore()
+        # several batches per run
+        self.store.batch_size = 2
+        client = TrackingClient(self.store)
+        with self.store:
+            experiment = client.create_experiment("Test Experiment")
+            self.run_ = experiment.start_run("Test Run")
+            self.run_.log_param("lr", 0.1)
+            for epoch in range(3):
+                epoch_val = self.run_.log_param("epoch", epoch)
+                self.run_.log_metric("loss", 1 / (epoch + 1), step=epoch_val)
+
+    def test_matches_get_values(self):
+        expected = [
+            (variable.key, value.id, value.value, value.step_id)
+            for variable, value in self.run_.get_values()
+        ]
+        actual = [
+            (variable.key, value.id, value.value, value.step_id)
+            for variable, value in self.run_.iter_values()
+        ]
+        self.assertEqual(actual, expected)
+
+    def test_tree_matches_get_values(self):
+        self.assertEqual(
+            TreeNode.from_values(self.run_.iter_values()),
+            TreeNode.from_values(self.run_.get_values()),
+        )
+
+    def test_close_partly_consumed_iterator(self):
+        values = self.run_.iter_values()
+        next(values)
+        values.close()
+        # nothing (context, session or lock) is left behind by the iterator
+        self.assertIsNone(store_cv.get())
+        with self.store:
+            self.run_.log_metric("loss", 0.0)
+        self.assertEqual(len(self.run_.get_values()), 8)
+
+    def test_interleaved_iterators(self):
+        first, second = self.run_.iter_values(), self.run_.iter_values()
+        pairs = list(zip(first, second))
+        self.assertEqual(len(pairs), 7)
+        for (_, left), (_, right) in pairs:
+            self.assertEqual(left.id, right.id)
+        self.assertIsNone(store_cv.get())
+
+
+if __name__ == "__main__":
+    unittest.main()
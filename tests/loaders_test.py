@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+
+from octoflow.data.loaders import dataloader, get_loader, load_json, loaders
+
+
+class GetLoaderTestCase(unittest.TestCase):
+    def test_get_builtin_loader(self):
+        loader = get_loader("json")
+        self.assertIs(loader, loaders["json"])
+        self.assertEqual(loader.extensions, [".json"])
+
+    def test_get_registered_loader(self):
+        self.addCleanup(loaders.pop, "test_loader", None)
+
+        @dataloader(name="test_loader")
+        def load(path):
+            return [{"path": path}]
+
+        loader = get_loader("test_loader")
+        self.assertEqual(loader("data"), [{"path": "data"}])
+
+    def test_unknown_loader_raises(self):
+        with self.assertRaises(ValueError) as cm:
+            get_loader("unknown")
+        self.assertIn("'unknown'", str(cm.exception))
+        self.assertIsNone(cm.exception.__cause__)
+
+
+class LoadJsonTestCase(unittest.TestCase):
+    def write(self, text):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_load_json(self):
+        data = [{"a": 1, "b": "\u00e9"}, {"a": 2.5, "b": None}]
+        path = self.write(json.dumps(data))
+        self.assertEqual(list(load_json(path)), [data])
+
+    def test_load_json_with_nan(self):
+        path = self.write('{"a": NaN}')
+        (document,) = load_json(path)
+        value = document["a"]
+        self.assertNotEqual(value, value)
+
+    def test_load_empty_json(self):
+        path = self.write("")
+        with self.assertRaises(json.JSONDecodeError):
+            list(load_json(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy.exc import IntegrityError
+
+from octoflow.tracking import SQLAlchemyTrackingStore, TrackingClient
+from octoflow.tracking.sqlalchemy_store import Variable
+
+
+class TestLogValues(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLAlchemyTrackingStore()
+        client = TrackingClient(self.store)
+        with self.store:
+            self.experiment = client.create_experiment("Test Experiment")
+            self.run_ = self.experiment.start_run("Test Run")
+
+    def get_values(self):
+        return [
+            (variable.key, value.value)
+            for variable, value in self.run_.get_values()
+        ]
+
+    def test_type_mismatch_commits_nothing(self):
+        self.run_.log_param("lr", 0.1)
+        with self.assertRaises(ValueError):
+            self.run_.log_metrics({"loss": 0.5, "lr": 0.2})
+        self.assertEqual(self.get_values(), [("lr", 0.1)])
+        # the variable of the failed batch was not created either
+        self.run_.log_param("loss", 1)
+        self.assertEqual(self.get_values(), [("lr", 0.1), ("loss", 1)])
+
+    def test_concurrent_variable_falls_back_to_single_inserts(self):
+        store = self.store
+
+        def create_variable_then_fail(*args, **kwargs):
+            # another writer creates the variable first
+            with store.session() as session:
+                session.add(
+                    Variable(
+                        experiment_id=self.experiment.id,
+                        key="loss",
+                        type="metric",
+                        parent_id=None,
+                        is_step=False,
+                    )
+                )
+                session.commit()
+            msg = "UNIQUE constraint failed"
+            raise IntegrityError(msg, {}, Exception(msg))
+
+        with mock.patch.object(
+            store, "_prepare_value_rows", create_variable_then_fail
+        ):
+            logged = self.run_.log_metrics({"loss": 0.5, "acc": 0.9})
+        self.assertEqual([value.value for value in logged], [0.5, 0.9])
+        self.assertTrue(all(value.id is not None for value in logged))
+        self.assertEqual(self.get_values(), [("loss", 0.5), ("acc", 0.9)])
+        self.run_.log_metrics({"loss": 0.25})
+        # the concurrently created variable is reused
+        variable_ids = {variable.id for variable, _ in self.run_.get_values()}
+        self.assertEqual(len(variable_ids), 2)
+
+    def test_batches_of_batch_size(self):
+        self.store.batch_size = 3
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.startswith("INSERT INTO value"):
+                statements.append(statement)
+
+        sqlalchemy.event.listen(
+            self.store.engine, "before_cursor_execute", before_cursor_execute
+        )
+        try:
+            metrics = {f"m{i}": float(i) for i in range(8)}
+            logged = self.run_.log_metrics(metrics)
+        finally:
+            sqlalchemy.event.remove(
+                self.store.engine,
+                "before_cursor_execute",
+                before_cursor_execute,
+            )
+        # 8 values in multi-row INSERTs of at most 3 rows
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(
+            [value.value for value in logged], list(metrics.values())
+        )
+        # ids are matched with the rows they were returned for
+        self.assertEqual(
+            [value.id for value in logged],
+            [value.id for _, value in self.run_.get_values()],
+        )
+        self.assertEqual(self.get_values(), list(metrics.items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
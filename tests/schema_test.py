@@ -0,0 +1,55 @@
+import unittest
+
+import pyarrow as pa
+
+from octoflow.data.schema import validate
+from octoflow.exceptions import ValidationError
+
+
+def from_pylist_error(schema, data):
+    # the outcome of validating with PyArrow only
+    try:
+        pa.RecordBatch.from_pylist([data], schema)
+    except pa.lib.ArrowInvalid:
+        return ValidationError
+    except Exception as e:
+        return type(e)
+    return None
+
+
+class ValidateTestCase(unittest.TestCase):
+    def assert_validates_like_pyarrow(self, data_type, value, nullable=True):
+        schema = pa.schema([pa.field("a", data_type, nullable)])
+        data = {"a": value}
+        expected = from_pylist_error(schema, data)
+        if expected is None:
+            validate(schema, data)
+        else:
+            with self.assertRaises(expected):
+                validate(schema, data)
+
+    def test_bool_in_int_field(self):
+        self.assert_validates_like_pyarrow(pa.int64(), True)
+        self.assert_validates_like_pyarrow(pa.int8(), False)
+
+    def test_int_in_float64_field(self):
+        self.assert_validates_like_pyarrow(pa.float64(), 1)
+        self.assert_validates_like_pyarrow(pa.float64(), 2**53 + 1)
+
+    def test_out_of_range_uint8(self):
+        self.assert_validates_like_pyarrow(pa.uint8(), 255)
+        self.assert_validates_like_pyarrow(pa.uint8(), 256)
+        self.assert_validates_like_pyarrow(pa.uint8(), -1)
+
+    def test_none_in_non_nullable_field(self):
+        self.assert_validates_like_pyarrow(pa.int64(), None, nullable=False)
+        self.assert_validates_like_pyarrow(pa.string(), None, nullable=False)
+
+    def test_invalid_value_raises(self):
+        schema = pa.schema([pa.field("a", pa.uint8())])
+        with self.assertRaises(ValidationError):
+            validate(schema, {"a": 256})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import pyarrow as pa
+
+from octoflow.data.types import unify_types
+
+
+class UnifyTypesTestCase(unittest.TestCase):
+    def test_unify_nested_struct_fields(self):
+        left = pa.struct([("a", pa.list_(pa.int32())), ("b", pa.string())])
+        right = pa.struct([("a", pa.list_(pa.int64())), ("c", pa.bool_())])
+        self.assertEqual(
+            unify_types(left, right),
+            pa.struct([
+                ("a", pa.list_(pa.int64())),
+                ("b", pa.string()),
+                ("c", pa.bool_()),
+            ]),
+        )
+
+    def test_unify_error_names_the_field(self):
+        left = pa.struct([("a", pa.struct([("b", pa.list_(pa.string()))]))])
+        right = pa.struct([("a", pa.struct([("b", pa.int64())]))])
+        with self.assertRaises(ValueError) as cm:
+            unify_types(left, right)
+        self.assertIn("of field 'a'", str(cm.exception))
+        cause = cm.exception.__cause__
+        self.assertIsInstance(cause, ValueError)
+        self.assertIn("of field 'b'", str(cause))
+        self.assertIsInstance(cause.__cause__, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()